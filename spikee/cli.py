@@ -9,25 +9,9 @@ from . import __version__
 from dotenv import load_dotenv
 from pathlib import Path
 
-from .generator import generate_dataset, generate_plugin
-from .tester import test_dataset
-from .results import (
-    analyze_results,
-    rejudge_results,
-    extract_results,
-    dataset_comparison,
-    convert_results_to_excel,
-)
-from .list import (
-    list_seeds,
-    list_datasets,
-    list_judges,
-    list_targets,
-    list_plugins,
-    list_attacks,
-    list_providers,
-)
-from .viewers.results import ResultsViewer
+# Sub-command implementations (and their heavy dependencies: flask, rich,
+# pandas, LLM SDKs, ...) are imported inside the dispatch branches in main(),
+# so each invocation only pays for the command it actually runs.
 
 banner = r"""
    _____ _____ _____ _  ________ ______
@@ -424,6 +408,12 @@ def main():
         default=None,
         help="Judge options, typically the name of the LLM to use as a judge",
     )
+    parser_rejudge.add_argument(
+        "--threads",
+        type=int,
+        default=4,
+        help="Number of threads for parallel re-judging (default: 4)",
+    )
     parser_rejudge.add_argument(
         "--resume",
         action="store_true",
@@ -615,13 +605,25 @@ def main():
         )
 
     elif args.command == "generate":
+        from .generator import generate_dataset, generate_plugin
+
         if args.generate_command == "plugin":
             generate_plugin(args)
         else:
             generate_dataset(args)
     elif args.command == "test":
+        from .tester import test_dataset
+
         test_dataset(args)
     elif args.command == "results":
+        from .results import (
+            analyze_results,
+            rejudge_results,
+            extract_results,
+            dataset_comparison,
+            convert_results_to_excel,
+        )
+
         if args.results_command == "analyze":
             analyze_results(args)
         elif args.results_command == "rejudge":
@@ -637,12 +639,24 @@ def main():
 
     elif args.command == "viewer":
         if args.viewer_command == "results":
+            from .viewers.results import ResultsViewer
+
             viewer = ResultsViewer(args)
             viewer.run_viewer(args)
         else:
             parser_viewer.print_help()
 
     elif args.command == "list":
+        from .list import (
+            list_seeds,
+            list_datasets,
+            list_judges,
+            list_targets,
+            list_plugins,
+            list_attacks,
+            list_providers,
+        )
+
         if args.list_command == "seeds":
             list_seeds(args)
         elif args.list_command == "datasets":
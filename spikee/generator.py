@@ -1333,17 +1333,23 @@ def generate_dataset(args):
     if tag:
         output_file_name += f"-{tag}"
 
-    output_file_path = os.path.join("datasets", output_file_name)
+    output_file_base = os.path.join("datasets", output_file_name)
+    extension = "txt" if output_format == "burp" else "jsonl"
+
+    os.makedirs("datasets", exist_ok=True)
+
+    # Timestamps are second-resolution, so back-to-back runs can produce the
+    # same name; bump the timestamp until it is free rather than overwriting
+    output_file_path = f"{output_file_base}-dataset-{timestamp}.{extension}"
+    while os.path.exists(output_file_path):
+        timestamp += 1
+        output_file_path = f"{output_file_base}-dataset-{timestamp}.{extension}"
 
     if output_format == "burp":
-        output_file_path += f"-dataset-{timestamp}.txt"
-        os.makedirs("datasets", exist_ok=True)
         with open(output_file_path, "w", encoding="utf-8") as f:
             for payload in dataset:
                 f.write(payload + "\n")
     else:
-        output_file_path += f"-dataset-{timestamp}.jsonl"
-        os.makedirs("datasets", exist_ok=True)
         write_jsonl_file(output_file_path, dataset)
 
     print(f"Dataset generated and saved to {output_file_path}")
@@ -18,6 +18,7 @@ def annotate_judge_options(entries, judge_opts):
             else:
                 judge_module = load_module_from_path(judge, "judges")
                 effective_options = get_default_option(judge_module)
+                default_map[judge] = effective_options
         else:
             # Use provided judge options for all entries
             effective_options = judge_opts
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -49,6 +50,10 @@ class Module:
     options: Optional[List[str]] = None
     tags: Optional[List[ModuleTag]] = None
     description: Optional[str] = ""
+    # Precomputed at collection time so rendering does no per-module work
+    tags_markup: str = ""
+    options_markup: str = ""
+    sort_key: tuple = ((99, ""),)
 
 
 def _render_section(
@@ -64,11 +69,11 @@ def _render_section(
     local_entries = []
     builtin_entries = []
 
-    def collect_module_data(module):
+    def collect_module_data(module, local):
         uses_llm = False
 
         try:
-            mod = load_module_from_path(module, module_type)
+            mod = load_module_from_path(module, module_type, local=local)
 
             options_data = get_options_from_module(mod)
             if (
@@ -95,22 +100,57 @@ def _render_section(
             tags = []
             description = ""
 
+        # Sort tags and render their markup once, instead of per table render
+        sorted_tags = sorted(tags, key=lambda t: (formatting_priority(t), t.value))
+        tag_parts = []
+        for tag in sorted_tags:
+            c = module_tag_to_colour(tag)
+            tag_parts.append(f"[{c}]{tag.value}[/{c}]")
+
+        # Same for the options column
+        if options is not None and len(options) > 0:
+            if options[0].startswith("<error - ") or options == [
+                "<import error - check module for dependencies>"
+            ]:
+                options_markup = f"[red]{options[0]}[/red]"
+            else:
+                opt_parts = [
+                    f"{options[0]} [bold][white](default)[/white][/bold]"
+                ] + options[1:]
+                options_markup = ", ".join(opt_parts)
+        else:
+            options_markup = ""
+
         module_data = Module(
             name=module,
             options=options,
-            tags=tags,
+            tags=sorted_tags,
             description=description,
+            tags_markup=", ".join(tag_parts),
+            options_markup=options_markup,
+            sort_key=tuple((formatting_priority(t), t.value) for t in sorted_tags)
+            or ((99, ""),),
         )
         return module_data, uses_llm
 
-    for local_module in local:
-        module, mod_uses_llm = collect_module_data(local_module)
+    # Module imports are I/O bound (file reads plus arbitrary SDK imports), so
+    # load them concurrently; executor.map preserves the listing order
+    with ThreadPoolExecutor(
+        max_workers=min(32, max(len(local) + len(builtin), 1))
+    ) as executor:
+        local_results = list(
+            executor.map(lambda m: collect_module_data(m, local=True), local)
+        )
+        builtin_results = list(
+            executor.map(lambda m: collect_module_data(m, local=False), builtin)
+        )
+
+    for module, mod_uses_llm in local_results:
         local_entries.append(module)
         if mod_uses_llm:
             uses_llm = True
 
-    for builtin_module in builtin:
-        module, mod_uses_llm = collect_module_data(builtin_module)
+    for module, mod_uses_llm in builtin_results:
         builtin_entries.append(module)
         if mod_uses_llm:
             uses_llm = True
@@ -146,38 +186,12 @@ Supported Providers (use 'spikee list providers' for more): {", ".join(providers
         if add_description:
             table.add_column("Description")
 
-        def _module_sort_key(m):
-            if m.tags:
-                return tuple(sorted((formatting_priority(t), t.value) for t in m.tags))
-            return ((99, ""),)
-
-        for module in sorted(entries, key=_module_sort_key):
+        for module in sorted(entries, key=lambda m: m.sort_key):
             # Tags
-            if module.tags:
-                sorted_tags = sorted(
-                    module.tags, key=lambda x: (formatting_priority(x), x.value)
-                )
-                tag_parts = []
-                for tag in sorted_tags:
-                    c = module_tag_to_colour(tag)
-                    tag_parts.append(f"[{c}]{tag.value}[/{c}]")
-                tags_str = ", ".join(tag_parts)
-            else:
-                tags_str = ""
+            tags_str = module.tags_markup
 
             # Options
-            if module.options is not None and len(module.options) > 0:
-                if module.options[0].startswith("<error - ") or module.options == [
-                    "<import error - check module for dependencies>"
-                ]:
-                    opts_str = f"[red]{module.options[0]}[/red]"
-                else:
-                    opt_parts = [
-                        f"{module.options[0]} [bold][white](default)[/white][/bold]"
-                    ] + module.options[1:]
-                    opts_str = ", ".join(opt_parts)
-            else:
-                opts_str = ""
+            opts_str = module.options_markup
 
             row = [module.name, tags_str, opts_str]
             if add_description:
@@ -2,11 +2,13 @@ import json
 import os
 import pandas as pd  # Required for Excel conversion
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 from .judge import annotate_judge_options, call_judge
 from .utilities.files import (
     read_jsonl_file,
+    read_jsonl_iter,
     write_jsonl_file,
     process_jsonl_input_files,
     extract_prefix_from_file_name,
@@ -157,7 +159,25 @@ def rejudge_results(args):
             )
             mode = "w"
 
-        # Stream write, allows CTRL+C leaves a partial file
+        # Skip already completed
+        pending = [entry for entry in results if entry["id"] not in completed_ids]
+
+        def rejudge_entry(entry):
+            try:
+                entry["success"] = call_judge(entry, entry["response"])
+
+            except Exception as e:
+                error_message = str(e)
+                entry["success"] = False
+                print("[Error] {}: {}".format(entry["id"], error_message))
+                traceback.print_exc()
+
+            return entry
+
+        # Judge entries concurrently (LLM judges spend their time waiting on the
+        # network) and stream-write from the main thread, so CTRL+C leaves a
+        # partial file
+        executor = ThreadPoolExecutor(max_workers=args.threads)
         with open(output_file, mode, encoding="utf-8") as out_f:
             try:
                 with tqdm(
@@ -170,19 +190,9 @@ def rejudge_results(args):
                     pbar.set_postfix(success=success_count)
 
                     # Process results
-                    for entry in results:
-                        # Skip already completed
-                        if entry["id"] in completed_ids:
-                            continue
-
-                        try:
-                            entry["success"] = call_judge(entry, entry["response"])
-
-                        except Exception as e:
-                            error_message = str(e)
-                            entry["success"] = False
-                            print("[Error] {}: {}".format(entry["id"], error_message))
-                            traceback.print_exc()
+                    futures = [executor.submit(rejudge_entry, e) for e in pending]
+                    for future in as_completed(futures):
+                        entry = future.result()
 
                         # Update progress bar
                         if entry.get("success", False):
@@ -196,9 +206,12 @@ def rejudge_results(args):
                         pbar.set_postfix(success=success_count)
 
             except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
                 print(
                     f"\n[Interrupt] CTRL+C pressed. Partial results saved to {output_file}"
                 )
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
 
 def extract_results(args):
@@ -243,10 +256,8 @@ def extract_results(args):
 
         source = result_file.split(os.sep)[-1].removesuffix(".jsonl")
 
-        # Load the results data
-        results = read_jsonl_file(result_file)
-
-        for entry in results:
+        # Stream the results data; only matching entries are retained
+        for entry in read_jsonl_iter(result_file):
             total_count += 1
             entry["source_file"] = result_file
 
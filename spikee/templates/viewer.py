@@ -1,10 +1,27 @@
 from abc import ABC, abstractmethod
 from flask import Flask
+import jinja2
 import os
 import logging
 
 from spikee.templates.module import Module
 
+# Serialize template/jsonify payloads with orjson when it is installed;
+# stdlib-backed Flask default otherwise
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+except ImportError:
+    _OrjsonProvider = None
+
 
 class Viewer(Module, ABC):
     def __init__(self):
@@ -17,13 +34,32 @@ class Viewer(Module, ABC):
         )
         logging.getLogger("werkzeug").setLevel(logging.INFO)
 
+        if _OrjsonProvider is not None:
+            self.app.json = _OrjsonProvider(self.app)
+
         # App Constants
         self.app.jinja_env.globals["app_name"] = self.viewer_name
 
-        # Set up context processor for templates
+        # Persist compiled templates across restarts and warm them up front,
+        # so the first request does not pay the parse/compile cost
+        cache_folder = os.path.join(viewer_folder, ".jinja_cache")
+        os.makedirs(cache_folder, exist_ok=True)
+        self.app.jinja_env.bytecode_cache = jinja2.FileSystemBytecodeCache(
+            directory=cache_folder
+        )
+
+        for template_name in self.app.jinja_env.list_templates(
+            extensions=["html"]
+        ):
+            self.app.jinja_env.get_template(template_name)
+
+        # Set up context processor for templates; the helper dict is constant
+        # per viewer instance, so build it once instead of per request
+        context = self.context_processor
+
         @self.app.context_processor
         def utility_processor():
-            return self.context_processor
+            return context
 
         self.setup_routes()
 
@@ -47,7 +83,19 @@ class Viewer(Module, ABC):
 
     # endregion
     def run_viewer(self, args):
-        self.app.run(debug=args.debug, host=args.host, port=args.port)
+        if args.debug:
+            # Werkzeug's dev server keeps hot-reloading for development
+            self.app.run(debug=True, host=args.host, port=args.port)
+            return
+
+        try:
+            from waitress import serve
+        except ImportError:
+            self.app.run(debug=False, host=args.host, port=args.port)
+            return
+
+        print(f"[Viewer] Serving {self.viewer_name} on http://{args.host}:{args.port}")
+        serve(self.app, host=args.host, port=args.port, threads=8)
 
     @abstractmethod
     def setup_routes(self):
@@ -71,22 +71,24 @@ def formatting_priority(tag: ModuleTag) -> int:
             return 5
 
 
+_TAG_COLOUR_MAP = {
+    ModuleTag.MULTI: "magenta",
+    ModuleTag.SINGLE: "white",
+    ModuleTag.LLM: "yellow",
+    ModuleTag.LLM_TTS: "yellow",
+    ModuleTag.LLM_STT: "yellow",
+    ModuleTag.LLM_STS: "yellow",
+    ModuleTag.ML: "yellow",
+    ModuleTag.IMAGE: "bright_magenta",
+    ModuleTag.AUDIO: "bright_magenta",
+    ModuleTag.ATTACK_BASED: "red",
+    ModuleTag.ENCODING: "white",
+    ModuleTag.FORMATTING: "white",
+    ModuleTag.OBFUSCATION: "white",
+    ModuleTag.SOCIAL_ENGINEERING: "white",
+    ModuleTag.TRANSLATION: "white",
+}
+
+
 def module_tag_to_colour(tag: ModuleTag) -> str:
-    tag_colour_map = {
-        ModuleTag.MULTI: "magenta",
-        ModuleTag.SINGLE: "white",
-        ModuleTag.LLM: "yellow",
-        ModuleTag.LLM_TTS: "yellow",
-        ModuleTag.LLM_STT: "yellow",
-        ModuleTag.LLM_STS: "yellow",
-        ModuleTag.ML: "yellow",
-        ModuleTag.IMAGE: "bright_magenta",
-        ModuleTag.AUDIO: "bright_magenta",
-        ModuleTag.ATTACK_BASED: "red",
-        ModuleTag.ENCODING: "white",
-        ModuleTag.FORMATTING: "white",
-        ModuleTag.OBFUSCATION: "white",
-        ModuleTag.SOCIAL_ENGINEERING: "white",
-        ModuleTag.TRANSLATION: "white",
-    }
-    return tag_colour_map.get(tag, "white")
+    return _TAG_COLOUR_MAP.get(tag, "white")
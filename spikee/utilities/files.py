@@ -11,22 +11,28 @@ except ImportError:
 
 
 # ==== File I/O Operations for JSONL files ====
-def read_jsonl_file(file_path):
-    """Reads a JSONL file and returns a list of JSON objects."""
-    data = []
+def read_jsonl_iter(file_path):
+    """Yields JSON objects from a JSONL file one line at a time.
+
+    Use this over read_jsonl_file when entries are consumed in a single pass,
+    so large files are never fully materialized in memory.
+    """
     with open(file_path, "r", encoding="utf-8") as f:
         for i, line in enumerate(f, start=1):
             line = line.rstrip()
             if not line:
                 continue
             try:
-                data.append(json.loads(line))
+                yield json.loads(line)
             except json.JSONDecodeError as e:
                 print(f"JSONDecodeError on line {i}: {e}")
                 print(f"Faulty line {i}: {line}")
                 raise
 
-    return data
+
+def read_jsonl_file(file_path):
+    """Reads a JSONL file and returns a list of JSON objects."""
+    return list(read_jsonl_iter(file_path))
 
 
 def read_toml_file(file_path):
@@ -163,4 +169,13 @@ def prepare_output_file(directory, file_type, name_full, dataset_path, tag):
     )
 
     os.makedirs(directory, exist_ok=True)
-    return os.path.join(directory, filename)
+    path = os.path.join(directory, filename)
+
+    # Timestamps are second-resolution, so back-to-back runs can produce the
+    # same name; bump the timestamp until it is free rather than overwriting
+    while os.path.exists(path):
+        stem, ts = filename[: -len(".jsonl")].rsplit("_", 1)
+        filename = f"{stem}_{int(ts) + 1}.jsonl"
+        path = os.path.join(directory, filename)
+
+    return path
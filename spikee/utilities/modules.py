@@ -1,15 +1,21 @@
+import functools
 import importlib
 import inspect
 import os
 import re
 import json
-import pkgutil
+import sys
 from typing import Any, Dict, Optional, List, Tuple
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=256)
 def _resolve_impl_class(module, module_type):
-    """Return the first concrete implementation class for the given module."""
+    """Return the first concrete implementation class for the given module.
+
+    Memoized per module object: the inspect.getmembers scan would otherwise be
+    repeated for every load and every metadata query against the same module.
+    """
 
     match module_type:
         case "targets":
@@ -62,19 +68,57 @@ def _instantiate_impl(module, module_type):
 
 
 # ==== Loading Modules ====
-def load_module_from_path(name, module_type):
-    """Loads a module either from a local path or from the spikee package."""
+def _load_local_module(name, module_type, local_path):
+    """Loads a local module file, reusing the sys.modules copy when unchanged.
+
+    The module body must be executed eagerly (no importlib.util.LazyLoader):
+    load_module_from_path resolves the implementation class by inspecting the
+    module's members straight after loading, which would trigger a lazy module
+    anyway.
+    """
+    key = f"{module_type}.{name}"
+    mtime = os.stat(local_path).st_mtime
+
+    mod = sys.modules.get(key)
+    if (
+        mod is not None
+        and getattr(mod, "__file__", None) == local_path
+        and getattr(mod, "__spikee_mtime__", None) == mtime
+    ):
+        return mod
+
+    spec = importlib.util.spec_from_file_location(name, local_path)
+    if spec and spec.loader:
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+    else:
+        raise ImportError(f"Could not load module {name} from {local_path}")
+
+    mod.__spikee_mtime__ = mtime
+    sys.modules[key] = mod
+    return mod
+
+
+def cached_import(dotted: str):
+    """Returns an already-imported module from sys.modules, importing it if needed."""
+    mod = sys.modules.get(dotted)
+    if mod is not None and getattr(mod, "__spec__", None) is not None:
+        return mod
+    return importlib.import_module(dotted)
+
+
+def load_module_from_path(name, module_type, local: Optional[bool] = None):
+    """Loads a module either from a local path or from the spikee package.
+
+    Callers that already know where the module lives (e.g. from
+    collect_modules) can pass `local` to skip the filesystem probe.
+    """
     try:
         local_path = os.path.join(os.getcwd(), module_type, f"{name}.py")
-        if os.path.isfile(local_path):
-            spec = importlib.util.spec_from_file_location(name, local_path)
-            if spec and spec.loader:
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)
-            else:
-                raise ImportError(f"Could not load module {name} from {local_path}")
+        if os.path.isfile(local_path) if local is None else local:
+            mod = _load_local_module(name, module_type, local_path)
         else:
-            mod = importlib.import_module(f"spikee.{module_type}.{name}")
+            mod = cached_import(f"spikee.{module_type}.{name}")
 
     except ModuleNotFoundError as e:
         trimmed = str(e).split("No module named ")[-1].strip("'\"")
@@ -96,6 +140,17 @@ def load_module_from_path(name, module_type):
     return mod
 
 
+# Files that mark a datasets/ subfolder as a seed folder
+_WANTED_SEEDS = frozenset(
+    {
+        "base_user_inputs.jsonl",
+        "base_documents.jsonl",
+        "standalone_user_inputs.jsonl",
+        "standalone_attacks.jsonl",
+    }
+)
+
+
 def collect_seeds() -> List[str]:
     """Collects available seeds from workspace"""
 
@@ -106,20 +161,18 @@ def collect_seeds() -> List[str]:
         )
         return []
 
-    want = {
-        "base_user_inputs.jsonl",
-        "base_documents.jsonl",
-        "standalone_user_inputs.jsonl",
-        "standalone_attacks.jsonl",
-    }
-
-    seeds = sorted(
-        {
-            d.name
-            for d in path.iterdir()
-            if d.is_dir() and any((d / fn).is_file() for fn in want)
-        }
-    )
+    # One directory listing per candidate folder instead of a stat per wanted file
+    seeds = []
+    with os.scandir(path) as it:
+        for d in it:
+            if not d.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(d.path) as inner:
+                names = {e.name for e in inner if e.is_file(follow_symlinks=False)}
+            if _WANTED_SEEDS & names:
+                seeds.append(d.name)
+
+    seeds.sort()
     return seeds
 
 
@@ -137,26 +190,92 @@ def collect_datasets() -> List[str]:
     return datasets
 
 
+# Cached collect_modules() results, keyed by (module_type, cwd). Each entry stores
+# the directory mtimes it was computed from, so adding/removing modules invalidates it.
+_COLLECT_CACHE: Dict[
+    Tuple[str, str],
+    Tuple[
+        Tuple[Optional[float], Optional[float]], Tuple[List[str], List[str], List[str]]
+    ],
+] = {}
+
+
+def _dir_mtime(path) -> Optional[float]:
+    """Returns the mtime of a directory, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def clear_collect_cache():
+    """Clears the collect_modules() cache, forcing a re-scan on the next call."""
+    _COLLECT_CACHE.clear()
+
+
+def _iter_py_names(paths):
+    """Yields module names for the .py files across the given package paths.
+
+    Cheaper than pkgutil.iter_modules for plain directory packages: one scandir
+    per path instead of the importlib finder machinery, and subpackages are
+    excluded for free since only regular files are yielded.
+    """
+    for path in paths:
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if (
+                        entry.is_file(follow_symlinks=False)
+                        and entry.name.endswith(".py")
+                        and not entry.name.startswith("_")
+                    ):
+                        yield entry.name[: -len(".py")]
+        except OSError:
+            continue
+
+
 def collect_modules(module_type: str) -> Tuple[List[str], List[str], List[str]]:
-    """Collects available module names from both local and built-in sources."""
+    """Collects available module names from both local and built-in sources.
+
+    Results are cached per (module_type, cwd) and invalidated when the mtime of
+    the local or built-in module directory changes.
+    """
 
     # 1) Collect from local directory
     local_modules = set()
     path = Path(os.getcwd()) / module_type
-    if path.is_dir():
-        for file in sorted(path.glob("*.py")):
-            if file.suffix == ".py" and not file.stem.startswith("_"):
-                local_modules.add(file.stem)
 
-    # 2) Collect from built-in package
-    built_in_modules = set()
+    # 2) Resolve the built-in package (if any)
     try:
         pkg_mod = importlib.import_module(f"spikee.{module_type}")
-        for _, mod_name, is_pkg in pkgutil.iter_modules(pkg_mod.__path__):
-            if not is_pkg and not mod_name.startswith("_"):
-                built_in_modules.add(mod_name)
     except ModuleNotFoundError:
-        pass
+        pkg_mod = None
+
+    # Cache lookup - skip the directory scans if nothing changed since last call
+    cache_key = (module_type, os.getcwd())
+    mtimes = (
+        _dir_mtime(path),
+        _dir_mtime(pkg_mod.__path__[0]) if pkg_mod else None,
+    )
+    cached = _COLLECT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
+
+    if path.is_dir():
+        # os.scandir reuses the file type returned by the directory listing,
+        # avoiding the per-entry stat calls that Path.glob would trigger
+        with os.scandir(path) as it:
+            for entry in it:
+                if (
+                    entry.is_file(follow_symlinks=False)
+                    and entry.name.endswith(".py")
+                    and not entry.name.startswith("_")
+                ):
+                    local_modules.add(entry.name[: -len(".py")])
+
+    built_in_modules = set()
+    if pkg_mod is not None:
+        built_in_modules.update(_iter_py_names(pkg_mod.__path__))
 
     # 3) Check for duplicates
     duplicates = local_modules.intersection(built_in_modules)
@@ -165,9 +284,14 @@ def collect_modules(module_type: str) -> Tuple[List[str], List[str], List[str]]:
             f"Warning: Duplicate module names found in both local and built-in {module_type}: {', '.join(duplicates)}. Local versions will take precedence."
         )
 
-    # 4) Combine and return sorted list
-    all_modules = sorted(local_modules.union(built_in_modules))
-    return all_modules, sorted(local_modules), sorted(built_in_modules)
+    # 4) Combine, cache and return sorted list
+    result = (
+        sorted(local_modules.union(built_in_modules)),
+        sorted(local_modules),
+        sorted(built_in_modules),
+    )
+    _COLLECT_CACHE[cache_key] = (mtimes, result)
+    return result
 
 
 def get_options_from_module(module, module_type=None):
@@ -365,7 +365,7 @@ class ResultProcessor:
         self.group_features = {}
 
         # Track Triggered Guardrail Categories
-        self.guardrail_categories = {}
+        self.guardrail_categories = defaultdict(int)
 
         # Check if any dynamic attacks were used
         self.has_dynamic_attacks = False
@@ -450,8 +450,6 @@ class ResultProcessor:
                     categories = entry.get("guardrail_categories", {})
                     for category, triggered in categories.items():
                         if triggered:
-                            if category not in self.guardrail_categories:
-                                self.guardrail_categories[category] = 0
                             self.guardrail_categories[category] += 1
 
             # Store the original entry's features to use in breakdowns
@@ -978,13 +976,16 @@ Accuracy: {accuracy:.4f} - Overall accuracy across all prompts
                 if attack_only_success:
                     self._breakdowns[field][value]["attack_only_successes"] += 1
 
-        # Output breakdowns
-        output = ""
+        # Output breakdowns (collected in a list and joined once, rather than
+        # growing a string per field)
+        parts = []
         for field in breakdown_fields:
             data = self._breakdowns[field]
 
             if data:
-                output += f"\n=== Breakdown by {field.replace('_', ' ').title()} ==="
+                parts.append(
+                    f"\n=== Breakdown by {field.replace('_', ' ').title()} ==="
+                )
                 table = []
 
                 if self.has_dynamic_attacks:
@@ -1062,9 +1063,9 @@ Accuracy: {accuracy:.4f} - Overall accuracy across all prompts
                         "Success Rate",
                     ]
 
-                output += "\n" + tabulate(table, headers=headers) + "\n"
+                parts.append("\n" + tabulate(table, headers=headers) + "\n")
 
-        return output
+        return "".join(parts)
 
     def generate_guardrail_categories(self):
         """Generates the guardrail category breakdown section."""
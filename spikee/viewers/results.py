@@ -10,15 +10,68 @@ from spikee.utilities.results import ResultProcessor, generate_query, extract_en
 from spikee.utilities.hinting import ModuleDescriptionHint, ModuleOptionsHint
 from spikee.judge import call_judge
 
-from flask import render_template, request, redirect, abort
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import render_template, request, redirect, abort, make_response
+from markupsafe import escape
 
 import ast
+import functools
 import hashlib
-import html
 import json
+import os
 import re
 from typing import Dict, Any, Tuple, Union
 
+# orjson parses the response column several times faster than the stdlib;
+# fall back to json when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Compiled once; heading highlighting runs over every processor output
+_HEADING_RE = re.compile(r"===\s*(.*?)\s*===")
+
+# Fixed categories indexed at load time for /file/ filtering
+_INDEXED_CATEGORIES = ("success", "failure", "error", "guardrail", "no-guardrail")
+
+
+def _is_safe_relative_url(url: str) -> bool:
+    """Accept only same-site relative paths for post-task redirects.
+
+    Ordered so the common failure modes (empty, not rooted, scheme-relative)
+    bail out before any allocation; the scheme check only slices when the URL
+    carries a query string.
+    """
+    if not url or url[:1] != "/" or url[:2] == "//":
+        return False
+
+    q = url.find("?")
+    return ":" not in (url if q < 0 else url[:q])
+
+
+def _heading_repl(match):
+    heading = match.group(1)
+    return f"<mark><strong>=== {heading} ===</strong></mark>"
+
+
+@functools.lru_cache(maxsize=2048)
+def _text_to_colour(text: str) -> str:
+    """Hash a string to a hex colour, memoized since the same few keys repeat."""
+
+    # Hash the string deterministically; only 3 bytes are needed for RGB
+    r, g, b = hashlib.blake2s(text.encode("utf-8"), digest_size=3).digest()
+
+    # Clamp to avoid too-dark or too-light colours
+    min_val, max_val = 80, 230  # allow slightly brighter colours
+
+    def clamp(x):
+        return min_val + (x % (max_val - min_val))
+
+    r, g, b = clamp(r), clamp(g), clamp(b)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
 
 class ResultsViewer(Viewer):
     @property
@@ -32,6 +85,7 @@ class ResultsViewer(Viewer):
         # Setup initial results files
         self._initial_results_files = args.result_file, args.result_folder
         self.loaded_files = {}  # Maps resource name -> file path for currently loaded files
+        self._resource_cache = {}  # Maps resource -> (loaded data, processor output)
 
         self.refresh_result_files()
 
@@ -45,6 +99,10 @@ class ResultsViewer(Viewer):
         )
         self.loaded = {}  # Loaded result data
         self.results_processor = None  # Loaded result processor output
+        self.category_index = {}  # Maps category -> set of entry ids
+        self._conversation_cache = {}  # Maps (conversation, truncated) -> HTML
+        self._source_entries = {}  # Maps file path -> raw entries, as written on disk
+        self._source_index = {}  # Maps file path -> {entry id -> raw entry}
 
         self.update_result_data(resource=self.selected_files)
 
@@ -73,6 +131,7 @@ class ResultsViewer(Viewer):
         print(" - " + "\n - ".join(results_files))
 
         self.loaded_files = {}
+        self._resource_cache.clear()
         resource_names = list()
         for file in results_files:
             resource_name = extract_resource_name(file)
@@ -89,18 +148,21 @@ class ResultsViewer(Viewer):
     ) -> Tuple[Dict[str, Any], ResultProcessor]:
         """Load and process result files, returning combined results and processed output."""
 
-        results = {}
-        for name, result_file in result_files.items():
+        def load_result_file(name, result_file):
             entries = read_jsonl_file(result_file)
 
-            for entry in entries:
+            file_results = {}
+            for raw_entry in entries:
+                # Display entries are shallow copies, so the raw list stays
+                # exactly as written on disk and can back task-action writes
+                entry = dict(raw_entry)
                 entry["source_file"] = result_file
 
                 if entry["response"] is not None and entry["response"] != "":
                     backup = entry["response"]
                     # First try to parse as JSON, then as a Python literal (if allow_ast is True), otherwise keep as string
                     try:
-                        entry["response"] = json.loads(entry["response"])
+                        entry["response"] = _json_loads(entry["response"])
                     except Exception:
                         if self.allow_ast:
                             try:
@@ -110,41 +172,73 @@ class ResultsViewer(Viewer):
                         else:
                             entry["response"] = backup
 
-                results[str(name + "-" + str(entry["id"]))] = entry
+                file_results[f"{name}-{entry['id']}"] = entry
+
+            return entries, file_results
+
+        # File reads and response parsing overlap across files; executor.map
+        # preserves the input order, so the merged dict is unchanged
+        with ThreadPoolExecutor(
+            max_workers=min(8, max(len(result_files), 1))
+        ) as executor:
+            loaded = executor.map(
+                lambda item: (item[1], load_result_file(*item)), result_files.items()
+            )
+
+            results = {}
+            for result_file, (entries, file_results) in loaded:
+                self._source_entries[result_file] = entries
+                self._source_index.pop(result_file, None)
+                results.update(file_results)
+
+        return results, self.generate_result_output(results, result_files)
+
+    def generate_result_output(
+        self, results: Dict[str, Any], result_files: Dict[str, str]
+    ) -> str:
+        """Generate the highlighted processor output for already-loaded results."""
 
         if len(result_files) > 1:
-            result_processor = self.highlight_resource_headings(
+            return self.highlight_resource_headings(
                 ResultProcessor(
                     results=results.values(), result_file="combined"
                 ).generate_output(combined=True)
             )
 
-        else:
-            result_processor = self.highlight_resource_headings(
-                ResultProcessor(
-                    results=results.values(), result_file=list(result_files.keys())[0]
-                ).generate_output()
-            )
-
-        return results, result_processor
+        return self.highlight_resource_headings(
+            ResultProcessor(
+                results=results.values(), result_file=list(result_files.keys())[0]
+            ).generate_output()
+        )
 
     def update_result_data(self, resource: str = "combined") -> bool:
         """Update the current result data based on the specified result file(s)."""
 
-        if resource == "combined":
-            self.selected_files = "combined"
-            self.loaded, self.results_processor = self.refresh_result_data(
-                result_files=self.loaded_files
-            )
+        if resource != "combined" and resource not in self.loaded_files:
+            return False
 
-        elif resource in self.loaded_files:
+        # Switching between selections reuses previously loaded data; the
+        # cache is dropped whenever the files themselves may have changed
+        cached = self._resource_cache.get(resource)
+        if cached is not None:
             self.selected_files = resource
+            self.loaded, self.results_processor = cached
+
+        else:
+            self.selected_files = resource
+
+            if resource == "combined":
+                selected = self.loaded_files
+            else:
+                selected = {resource: self.loaded_files[resource]}
+
             self.loaded, self.results_processor = self.refresh_result_data(
-                result_files={resource: self.loaded_files[resource]}
+                result_files=selected
             )
+            self._resource_cache[resource] = (self.loaded, self.results_processor)
 
-        else:
-            return False
+        self.category_index = self.build_category_index(self.loaded)
+        self._conversation_cache.clear()
 
         self.app.jinja_env.globals["selected_files"] = self.selected_files
         self.app.jinja_env.globals["loaded_result_data"] = self.loaded
@@ -152,6 +246,17 @@ class ResultsViewer(Viewer):
 
         return True
 
+    def build_category_index(self, results: Dict[str, Any]) -> Dict[str, set]:
+        """Index entry ids per fixed category, so filtering starts from a candidate set."""
+
+        index = {category: set() for category in _INDEXED_CATEGORIES}
+        for eid, entry in results.items():
+            for category, ids in index.items():
+                if extract_entries(entry, category):
+                    ids.add(eid)
+
+        return index
+
     # endregion
 
     # region Formatting Helpers
@@ -159,16 +264,7 @@ class ResultsViewer(Viewer):
     def highlight_resource_headings(self, result_output: str):
         """Highlight headings in the resource processor outputs by wrapping them in <mark> and <strong> tags."""
 
-        def repl(match):
-            heading = match.group(1)
-            return f"<mark><strong>=== {heading} ===</strong></mark>"
-
-        return re.sub(r"===\s*(.*?)\s*===", repl, result_output)
-
-    def truncate(self, text: str) -> str:
-        if self.truncate_length is not None and len(text) > self.truncate_length:
-            return text[: self.truncate_length] + "...[Truncated]"
-        return text
+        return _HEADING_RE.sub(_heading_repl, result_output)
 
     def process_text(self, text: Union[str, None], truncated: bool = False) -> str:
         """Process text for display."""
@@ -176,8 +272,14 @@ class ResultsViewer(Viewer):
         if text is None:
             return "—"
 
-        elif truncated:
-            return self.truncate(text)
+        if not truncated:
+            return text
+
+        # Truncation inlined so the common untruncated path above returns
+        # before any length check
+        limit = self.truncate_length
+        if limit is not None and len(text) > limit:
+            return text[:limit] + "...[Truncated]"
 
         return text
 
@@ -185,6 +287,14 @@ class ResultsViewer(Viewer):
         self, conversation_data: str, truncated: bool = False
     ) -> str:
         """Process a standardised conversation for display."""
+
+        # Rendering recurses over the whole tree and escapes every field, so
+        # repeat views of the same conversation reuse the rendered HTML
+        cache_key = (conversation_data, truncated)
+        cached = self._conversation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             conversation = StandardisedConversation()
             conversation.add_conversation(conversation_data)
@@ -192,41 +302,54 @@ class ResultsViewer(Viewer):
         except json.JSONDecodeError:  # return processed raw text
             return self.process_text(conversation_data, truncated=truncated)
 
-        def render_message(node, message) -> str:
-            """Render a single message as an HTML list item, including its content and metadata."""
-            # node_entry = f'<div class="code-block h-100 result-input"><strong style="color: {string_to_colour(str("node"))};">node:</strong> {html.escape(str(node))}</div>'
+        def render_message(node, message, buf) -> None:
+            """Render a single message as an HTML list item, appending fragments to buf."""
+            buf.append(
+                f"""<li class="mb-2" id={node} value={node}><div class="d-flex flex-column">"""
+            )
 
             if isinstance(message["data"], dict):
-                data = [
-                    f"""<div class="code-block h-100 result-input"><strong style="color: {self.text_to_colour(str(key))};">{html.escape(str(key))}:</strong> {html.escape(self.process_text(str(value), truncated))}</div>"""
-                    for key, value in message["data"].items()
-                ]
-
-                message = "".join(data)
+                for key, value in message["data"].items():
+                    buf.append(
+                        f"""<div class="code-block h-100 result-input"><strong style="color: {self.text_to_colour(str(key))};">{escape(str(key))}:</strong> {escape(self.process_text(str(value), truncated))}</div>"""
+                    )
             elif isinstance(message["data"], list):
-                data = [
-                    f"""<div class="code-block h-100 result-input">{html.escape(self.process_text(str(item), truncated))}</div>"""
-                    for item in message["data"]
-                ]
-                message = "".join(data)
+                for item in message["data"]:
+                    buf.append(
+                        f"""<div class="code-block h-100 result-input">{escape(self.process_text(str(item), truncated))}</div>"""
+                    )
             else:
-                message = f"""<div class="code-block h-100 result-input">{html.escape(self.process_text(str(message["data"]), truncated))}</div>"""
+                buf.append(
+                    f"""<div class="code-block h-100 result-input">{escape(self.process_text(str(message["data"]), truncated))}</div>"""
+                )
 
-            return f"""<li class="mb-2" id={node} value={node}><div class="d-flex flex-column">{message}</div></li>"""
+            buf.append("</div></li>")
 
-        def render_node(message_id: int) -> str:
-            """Recursively render a message and its children as nested HTML lists."""
-            message = conversation.get_message(message_id)
+        # Fragments accumulate into one list and are joined once, instead of
+        # concatenating nested strings at every level of the tree. The tree is
+        # walked with an explicit stack (None marks a pending closing tag), so
+        # deep conversations carry no recursion-depth limit or frame overhead
+        buf = ['<ol class="ps-3 mt-2">']
 
-            if message["children"] == []:
-                return render_message(message_id, message)
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                buf.append("</ol>")
+                continue
 
-            else:
-                children = [render_node(child_id) for child_id in message["children"]]
+            message = conversation.get_message(node)
+            render_message(node, message, buf)
+
+            if message["children"]:
+                buf.append('<ol class="ps-3 mt-2">')
+                stack.append(None)
+                stack.extend(reversed(message["children"]))
 
-                return f"""{render_message(message_id, message)}<ol class="ps-3 mt-2">{"".join(children)}</ol>"""
+        buf.append("</ol>")
 
-        conversation_html = f"""<ol class="ps-3 mt-2">{render_node(0)}</ol>"""
+        conversation_html = "".join(buf)
+        self._conversation_cache[cache_key] = conversation_html
         return conversation_html
 
     def text_to_colour(self, text: str) -> str:
@@ -237,19 +360,7 @@ class ResultsViewer(Viewer):
         Allows some slightly brighter colours.
         """
 
-        # Hash the string deterministically
-        hash_bytes = hashlib.md5(text.encode("utf-8")).digest()
-        # Use first 3 bytes for RGB
-        r, g, b = hash_bytes[0], hash_bytes[1], hash_bytes[2]
-
-        # Clamp to avoid too-dark or too-light colours
-        min_val, max_val = 80, 230  # allow slightly brighter colours
-
-        def clamp(x):
-            return min_val + (x % (max_val - min_val))
-
-        r, g, b = clamp(r), clamp(g), clamp(b)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _text_to_colour(text)
 
     # endregion
 
@@ -275,11 +386,16 @@ class ResultsViewer(Viewer):
                 if not self.update_result_data(resource=result_file):
                     self.refresh_result_files()
 
-                    description = f"<h1>File Not Found</h1> Result file '{result_file}' not found among loaded files:"
-                    for loaded_file in self.loaded_files.keys():
-                        description += f"<br> - {loaded_file}"
-
-                    description += "<br><br> <a href='/'>Return to overview</a>"
+                    description = "".join(
+                        [
+                            f"<h1>File Not Found</h1> Result file '{result_file}' not found among loaded files:",
+                            *(
+                                f"<br> - {loaded_file}"
+                                for loaded_file in self.loaded_files.keys()
+                            ),
+                            "<br><br> <a href='/'>Return to overview</a>",
+                        ]
+                    )
 
                     return description, 404
 
@@ -292,17 +408,16 @@ class ResultsViewer(Viewer):
 
         @self.app.route("/task", methods=["POST"])
         def task():
-            return_url = request.form.get("return_url", "")
-            task_action = request.form.get("task_action", "")
-
-            print(return_url, task_action)
+            form = request.form
+            return_url = form.get("return_url", "")
+            task_action = form.get("task_action", "")
 
             match task_action:
                 case "file_refresh":
                     self.refresh_result_files()
 
                     if (
-                        self.selected_files in list(self.loaded_files.keys())
+                        self.selected_files in self.loaded_files
                         or self.selected_files == "combined"
                     ):
                         self.update_result_data(resource=self.selected_files)
@@ -311,9 +426,11 @@ class ResultsViewer(Viewer):
                         self.update_result_data(resource="combined")
 
                 case "entry_refresh":
+                    # Force a re-read; the files may have changed on disk
+                    self._resource_cache.clear()
                     self.update_result_data(resource=self.selected_files)
 
-            if return_url:
+            if _is_safe_relative_url(return_url):
                 return redirect(return_url)
             else:
                 return redirect("/")
@@ -323,21 +440,29 @@ class ResultsViewer(Viewer):
             category = request.args.get("category", "")
             custom_search = request.args.get("custom_search", "")
 
-            # Filter entries based on category and custom search
+            # Filter entries based on category and custom search; fixed
+            # categories start from the precomputed index rather than testing
+            # every entry, and the custom query only runs on those candidates
             try:
-                custom_query = generate_query("custom", custom_search.split("|"))
-
-                matching_entries = {}
-                for eid, entry in self.loaded.items():
-                    flag = True
-                    if category != "" and category != "custom":
-                        flag = extract_entries(entry, category)
-
-                    if flag and custom_search != "":
-                        flag = extract_entries(entry, "custom", custom_query)
-
-                    if flag:
-                        matching_entries[eid] = entry
+                if category != "" and category != "custom":
+                    candidate_ids = self.category_index.get(category, set())
+                    candidates = (
+                        (eid, entry)
+                        for eid, entry in self.loaded.items()
+                        if eid in candidate_ids
+                    )
+                else:
+                    candidates = self.loaded.items()
+
+                if custom_search != "":
+                    custom_query = generate_query("custom", custom_search.split("|"))
+                    matching_entries = {
+                        eid: entry
+                        for eid, entry in candidates
+                        if extract_entries(entry, "custom", custom_query)
+                    }
+                else:
+                    matching_entries = dict(candidates)
 
                 return render_template(
                     "result_file.html",
@@ -357,12 +482,29 @@ class ResultsViewer(Viewer):
                 abort(404, description="Entry not found")
 
             else:
-                return render_template("result_entry.html", id=entry, entry=entry_data)
+                # ETag derived from the source file's mtime, so browser
+                # refreshes collapse to a 304 until the file is rewritten
+                etag = hashlib.blake2s(
+                    f"{os.path.getmtime(entry_data['source_file'])}-{entry}".encode(),
+                    digest_size=8,
+                ).hexdigest()
+
+                if etag in request.if_none_match:
+                    response = make_response("", 304)
+                    response.set_etag(etag)
+                    return response
+
+                response = make_response(
+                    render_template("result_entry.html", id=entry, entry=entry_data)
+                )
+                response.set_etag(etag)
+                return response.make_conditional(request)
 
         @self.app.route("/entry/<entry>/task", methods=["POST"])
         def entry_task(entry):
-            return_url = request.form.get("return_url", "")
-            task_action = request.form.get("task_action", "")
+            form = request.form
+            return_url = form.get("return_url", "")
+            task_action = form.get("task_action", "")
 
             # Validate entry exists
             entry_data = self.loaded.get(entry, None)
@@ -370,30 +512,71 @@ class ResultsViewer(Viewer):
                 abort(404, description="Entry not found")
 
             else:
-                # Process task action
-                jsonl_data = read_jsonl_file(entry_data["source_file"])
-                entry_id = str(entry_data["id"])
-                for item in jsonl_data:
-                    if str(item["id"]) == entry_id:
-                        match task_action:
-                            case "toggle_success":
-                                # Toggle success status
-                                item["success"] = not item.get("success", False)
-
-                            case "rejudge":
-                                # Rejudge individual entry
-                                item["success"] = call_judge(
-                                    item, item.get("response", "")
-                                )
-
-                        break
-
-                write_jsonl_file(entry_data["source_file"], jsonl_data)
-
-                # Reload files to reflect changes
-                self.update_result_data(self.selected_files)
-
-                if return_url:
+                # Process task action against the in-memory raw entries,
+                # falling back to disk if the file was never loaded
+                source_file = entry_data["source_file"]
+                jsonl_data = self._source_entries.get(source_file)
+                if jsonl_data is None:
+                    jsonl_data = read_jsonl_file(source_file)
+                    self._source_entries[source_file] = jsonl_data
+
+                # Look the entry up through a per-file id index instead of
+                # scanning the whole list; built lazily and dropped whenever
+                # the file is re-read
+                index = self._source_index.get(source_file)
+                if index is None:
+                    index = {str(item["id"]): item for item in jsonl_data}
+                    self._source_index[source_file] = index
+
+                item = index.get(str(entry_data["id"]))
+                if item is not None:
+                    match task_action:
+                        case "toggle_success":
+                            # Toggle success status
+                            item["success"] = not item.get("success", False)
+
+                        case "rejudge":
+                            # Rejudge individual entry
+                            item["success"] = call_judge(item, item.get("response", ""))
+
+                    write_jsonl_file(source_file, jsonl_data)
+
+                    # Mirror the change onto the in-memory entry and regenerate
+                    # the processor output from memory, instead of re-reading
+                    # and re-parsing every result file for a single-entry change
+                    entry_data["success"] = item["success"]
+
+                    for category, ids in self.category_index.items():
+                        ids.discard(entry)
+                        if extract_entries(entry_data, category):
+                            ids.add(entry)
+
+                    if self.selected_files == "combined":
+                        selected = self.loaded_files
+                    else:
+                        selected = {
+                            self.selected_files: self.loaded_files[self.selected_files]
+                        }
+
+                    self.results_processor = self.generate_result_output(
+                        self.loaded, selected
+                    )
+                    self.app.jinja_env.globals["loaded_result_processor"] = (
+                        self.results_processor
+                    )
+
+                    # Dirty the cached selections touching the mutated file; the
+                    # current selection was patched in place, so re-cache it
+                    for resource, file in self.loaded_files.items():
+                        if file == source_file:
+                            self._resource_cache.pop(resource, None)
+                    self._resource_cache.pop("combined", None)
+                    self._resource_cache[self.selected_files] = (
+                        self.loaded,
+                        self.results_processor,
+                    )
+
+                if _is_safe_relative_url(return_url):
                     return redirect(return_url)
                 else:
                     return redirect(f"/entry/{entry}")